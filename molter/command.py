@@ -1,3 +1,4 @@
+import asyncio
 import functools
 import inspect
 import re
@@ -5,7 +6,7 @@ import typing  # it's weird importing get_args and get_origin directly
 from contextlib import suppress
 from collections import deque
 from types import NoneType, UnionType
-from typing import Optional, Any, Callable, Sequence, Annotated, Literal, Union, TypeVar
+from typing import Optional, Any, Callable, Coroutine, Sequence, Annotated, Literal, Union, TypeVar
 
 import attrs
 
@@ -16,7 +17,7 @@ from dis_snek.models.snek.command import MessageCommand
 from dis_snek.models.snek.context import MessageContext
 
 from molter.errors import BadArgument
-from molter.converters import Converter, LiteralConverter, Greedy, SNEK_OBJECT_TO_CONVERTER
+from molter.converters import Converter, LiteralConverter, Greedy, SNEK_OBJECT_TO_CONVERTER, _is_converter
 
 __all__ = (
     "CommandParameter",
@@ -36,32 +37,39 @@ _pending_regex = r"(1.*2|[^\t\f\v ]+)"
 _pending_regex = _pending_regex.replace("1", f"[{''.join(list(_quotes.keys()))}]")
 _pending_regex = _pending_regex.replace("2", f"[{''.join(list(_quotes.values()))}]")
 ARGS_PARSE = re.compile(_pending_regex)
+_QUOTE_STARTS = frozenset(_quotes)
+_QUOTE_SEARCH = re.compile(f"[{''.join(_quotes.keys())}]")
+_UNION_ORIGINS = frozenset({Union, UnionType})
+_NON_GREEDY_KINDS = frozenset({inspect.Parameter.KEYWORD_ONLY, inspect.Parameter.VAR_POSITIONAL})
 
 
-@attrs.define(slots=True)
+# fields are set one by one while parsing parameters, and none of them need converting or validating then
+@attrs.define(slots=True, on_setattr=attrs.setters.NO_OP)
 class CommandParameter:
     """An object representing parameters in a command."""
 
     name: str = attrs.field(default=None)
     default: Optional[Any] = attrs.field(default=None)
     type: type = attrs.field(default=None)
-    converters: list[Callable[[MessageContext, str], Any]] = attrs.field(factory=list)
+    converters: list[tuple[Callable[[MessageContext, str], Any], bool]] = attrs.field(factory=list)
     greedy: bool = attrs.field(default=False)
     union: bool = attrs.field(default=False)
     variable: bool = attrs.field(default=False)
     consume_rest: bool = attrs.field(default=False)
+    _union_types_str: Optional[str] = attrs.field(default=None, init=False)
 
     @property
     def optional(self) -> bool:
-        return self.default != MISSING
+        return self.default is not MISSING
 
 
-@attrs.define(slots=True)
+@attrs.define(slots=True, on_setattr=attrs.setters.NO_OP)  # index is set on every step, so avoid attrs' __setattr__
 class ArgsIterator:
     """
     An iterator over the arguments of a command.
 
     Has functions to control the iteration.
+    Molter's own parser walks the arguments with a plain index instead, but this is kept around for compatibility.
     """
 
     args: Sequence[str] = attrs.field(converter=tuple)
@@ -97,20 +105,40 @@ class ArgsIterator:
 
 
 def _get_name(x: Any) -> str:
+    if (name := getattr(x, "__name__", None)) is not None:
+        return name
+    return repr(x) if getattr(x, "__origin__", None) is not None else type(x).__name__
+
+
+_cached_get_origin = functools.lru_cache(maxsize=None)(typing.get_origin)
+
+
+def _get_origin(anno: Any) -> Any:
+    # the same handful of annotations get looked at over and over while parsing parameters
+    # annotations that compare equal share a cache entry, so whichever is cached first decides the origin
+    # for all of them - the only equal annotations with different origins are unions like int | None and
+    # Optional[int] (types.UnionType vs typing.Union), and we treat those the same through _UNION_ORIGINS
     try:
-        return x.__name__
-    except AttributeError:
-        return repr(x) if hasattr(x, "__origin__") else x.__class__.__name__
+        return _cached_get_origin(anno)
+    except TypeError:  # unhashable annotations, like Annotated with an unhashable converter
+        return typing.get_origin(anno)
+
+
+_BOOL_MAP: dict[str, bool] = dict.fromkeys(("yes", "y", "true", "t", "1", "enable", "on"), True)
+_BOOL_MAP.update(dict.fromkeys(("no", "n", "false", "f", "0", "disable", "off"), False))
 
 
 def _convert_to_bool(argument: str) -> bool:
-    lowered = argument.lower()
-    if lowered in {"yes", "y", "true", "t", "1", "enable", "on"}:
-        return True
-    elif lowered in {"no", "n", "false", "f", "0", "disable", "off"}:
-        return False
-    else:
+    result = _BOOL_MAP.get(argument.lower())
+    if result is None:
         raise BadArgument(f"{argument} is not a recognised boolean option.")
+    return result
+
+
+def _convert_to_str(ctx: MessageContext, argument: str) -> str:
+    # used for unannotated and str parameters - this being a shared function lets us
+    # detect parameters that take their argument as-is
+    return str(argument)
 
 
 def _is_nested(func: Callable) -> bool:
@@ -150,8 +178,20 @@ def _get_from_anno_type(anno: Annotated, name: str) -> Any:
     return args[0]
 
 
-def _get_converter_function(anno: type[Converter] | Converter, name: str) -> Callable[[MessageContext, str], Any]:
-    num_params = len(inspect.signature(anno.convert).parameters.values())
+@functools.lru_cache(maxsize=None)
+def _get_signature(func: Callable) -> inspect.Signature:
+    # converter functions tend to be reused across many parameters and commands,
+    # and inspect.signature is far from cheap
+    return inspect.signature(func)
+
+
+def _get_converter_function(
+    anno: type[Converter] | Converter, name: str
+) -> tuple[Callable[[MessageContext, str], Any], bool]:
+    # a converter class's convert function is shared by every instance of it, so its signature can be cached,
+    # but instances are inspected directly so we don't keep them alive (or need them to be hashable)
+    convert_signature = _get_signature(anno.convert) if isinstance(anno, type) else inspect.signature(anno.convert)
+    num_params = len(convert_signature.parameters)
 
     # if we have three parameters for the function, it's likely it has a self parameter
     # so we need to get rid of it by initing - typehinting hates this, btw!
@@ -164,52 +204,56 @@ def _get_converter_function(anno: type[Converter] | Converter, name: str) -> Cal
     if num_params != 2:
         ValueError(f"{_get_name(anno)} for {name} is invalid: converters must have exactly 2 arguments.")
 
-    return actual_anno.convert
+    return actual_anno.convert, inspect.iscoroutinefunction(actual_anno.convert)
 
 
-def _get_converter(anno: type, name: str, type_to_converter: dict[type, type[Converter]]) -> Callable[[MessageContext, str], Any]:  # type: ignore
-    if typing.get_origin(anno) == Annotated:
+def _get_converter(anno: type, name: str, type_to_converter: dict[type, type[Converter]]) -> tuple[Callable[[MessageContext, str], Any], bool]:  # type: ignore
+    # we figure out if the converter needs to be awaited here rather than every time it's ran
+    if _get_origin(anno) == Annotated:
         anno = _get_from_anno_type(anno, name)
 
-    if isinstance(anno, Converter):
+    if _is_converter(anno):
         return _get_converter_function(anno, name)
     elif converter := type_to_converter.get(anno, None):
         return _get_converter_function(converter, name)
-    elif typing.get_origin(anno) is Literal:
+    elif _get_origin(anno) is Literal:
         literals = typing.get_args(anno)
-        return LiteralConverter(literals).convert
+        return LiteralConverter(literals).convert, True
     elif inspect.isfunction(anno):
-        num_params = len(inspect.signature(anno).parameters.values())
+        num_params = len(_get_signature(anno).parameters)
+        is_async = inspect.iscoroutinefunction(anno)
         match num_params:
             case 2:
-                return lambda ctx, arg: anno(ctx, arg)
+                return anno, is_async  # already takes what converters do, no need to wrap it
             case 1:
-                return lambda ctx, arg: anno(arg)
+                return (lambda ctx, arg: anno(arg)), is_async
             case 0:
-                return lambda ctx, arg: anno()
+                return (lambda ctx, arg: anno()), is_async
             case _:
                 ValueError(f"{_get_name(anno)} for {name} has more than 2 arguments, which is unsupported.")
     elif anno == bool:
-        return lambda ctx, arg: _convert_to_bool(arg)
-    elif anno == inspect._empty:
-        return lambda ctx, arg: str(arg)
+        return (lambda ctx, arg: _convert_to_bool(arg)), False
+    elif anno is inspect._empty or anno is str:
+        return _convert_to_str, False
     else:
-        return lambda ctx, arg: anno(arg)
+        return (lambda ctx, arg: anno(arg)), False
 
 
-def _greedy_parse(greedy: Greedy, param: inspect.Parameter) -> Any:
-    if param.kind in {param.KEYWORD_ONLY, param.VAR_POSITIONAL}:
+def _greedy_parse(greedy_args: tuple[Any, ...], param: inspect.Parameter) -> Any:
+    if param.kind in _NON_GREEDY_KINDS:
         raise ValueError("Greedy[...] cannot be a variable or keyword-only argument.")
 
-    arg = typing.get_args(greedy)[0]
+    arg = greedy_args[0]
+    origin = _get_origin(arg)
 
-    if typing.get_origin(arg) == Annotated:
+    if origin is Annotated:
         arg = _get_from_anno_type(arg, param.name)
+        origin = _get_origin(arg)
 
     if arg in {NoneType, str}:
         raise ValueError(f"Greedy[{_get_name(arg)}] is invalid.")
 
-    if typing.get_origin(arg) in {Union, UnionType} and NoneType in typing.get_args(arg):
+    if origin in _UNION_ORIGINS and NoneType in typing.get_args(arg):
         raise ValueError(f"Greedy[{repr(arg)}] is invalid.")
 
     return arg
@@ -220,27 +264,32 @@ def _get_params(
 ) -> list[CommandParameter]:
     cmd_params: list[CommandParameter] = []
 
-    # ignoring self it is exists
-    if has_self:
-        callback = functools.partial(func, None, None)
-    else:
-        callback = functools.partial(func, None)
-
-    params = inspect.signature(callback).parameters
-    for name, param in params.items():
+    # ignoring self if it exists, and ctx
+    params = tuple(inspect.signature(func).parameters.values())[2 if has_self else 1 :]
+    for param in params:
+        name = param.name
         cmd_param = CommandParameter()
         cmd_param.name = name
         cmd_param.default = param.default if param.default is not param.empty else MISSING
 
         cmd_param.type = anno = param.annotation
 
-        if typing.get_origin(anno) == Greedy:
-            anno = _greedy_parse(anno, param)
+        origin = _get_origin(anno)
+
+        if origin is Greedy:
+            anno = _greedy_parse(typing.get_args(anno), param)
+            origin = _get_origin(anno)
             cmd_param.greedy = True
 
-        if typing.get_origin(anno) in {Union, UnionType}:
+        if origin in _UNION_ORIGINS:
             cmd_param.union = True
-            for arg in typing.get_args(anno):
+            union_args = typing.get_args(anno)
+
+            # only used for errors, but it never changes, so may as well make it now
+            union_names = tuple(_get_name(t) for t in union_args)
+            cmd_param._union_types_str = ", ".join(union_names[:-1]) + f", or {union_names[-1]}"
+
+            for arg in union_args:
                 if arg != NoneType:
                     converter = _get_converter(arg, name, type_to_converter)
                     cmd_param.converters.append(converter)
@@ -270,7 +319,7 @@ def _get_params(
 
 
 def _arg_fix(arg: str) -> str:
-    return arg[1:-1] if arg[0] in _quotes.keys() else arg
+    return arg[1:-1] if arg[:1] in _QUOTE_STARTS else arg
 
 
 async def maybe_coroutine(func: Callable, *args, **kwargs) -> Any:
@@ -281,61 +330,233 @@ async def maybe_coroutine(func: Callable, *args, **kwargs) -> Any:
         return func(*args, **kwargs)
 
 
-async def _convert(param: CommandParameter, ctx: MessageContext, arg: str) -> tuple[Any, bool]:
-    converted = MISSING
-    for converter in param.converters:
-        try:
-            converted = await maybe_coroutine(converter, ctx, arg)
-            break
-        except Exception as e:
-            if not param.union and not param.optional:
+_ConvertFunction = Callable[[MessageContext, str], Coroutine[Any, Any, tuple[Any, bool]]]
+
+
+def _get_single_convert(param: CommandParameter) -> _ConvertFunction:
+    # the vast majority of parameters aren't unions, so they get a simpler path
+    # with their only converter and if it needs to be awaited baked in
+    converter, is_async = param.converters[0]
+    optional = param.optional
+    default = param.default
+
+    if converter is _convert_to_str:
+        # arguments are already strings, and this can't fail
+
+        async def convert(ctx: MessageContext, arg: str) -> tuple[Any, bool]:
+            return arg, False
+
+    elif is_async:
+
+        async def convert(ctx: MessageContext, arg: str) -> tuple[Any, bool]:
+            try:
+                return await converter(ctx, arg), False
+            except Exception as e:
+                if optional:
+                    return default, True
                 if isinstance(e, BadArgument):
                     raise
                 raise BadArgument(str(e)) from e
 
-    used_default = False
-    if converted == MISSING:
-        if param.optional:
-            converted = param.default
-            used_default = True
-        else:
-            union_types = typing.get_args(param.type)
-            union_names = tuple(_get_name(t) for t in union_types)
-            union_types_str = ", ".join(union_names[:-1]) + f", or {union_names[-1]}"
-            raise BadArgument(f'Could not convert "{arg}" into {union_types_str}.')
+    else:
+
+        async def convert(ctx: MessageContext, arg: str) -> tuple[Any, bool]:
+            try:
+                return converter(ctx, arg), False
+            except Exception as e:
+                if optional:
+                    return default, True
+                if isinstance(e, BadArgument):
+                    raise
+                raise BadArgument(str(e)) from e
 
-    return converted, used_default
+    return convert
 
 
-async def _greedy_convert(
-    param: CommandParameter, ctx: MessageContext, args: ArgsIterator
-) -> tuple[list[Any] | Any, bool]:
-    args.back()
-    broke_off = False
-    greedy_args = []
+# returned when no converter could convert an argument
+# we use this rather than exceptions for the places where failing is expected, like
+# trying each type of a union or finding where a greedy argument stops
+_FAIL = object()
+
 
-    for arg in args:
+async def _try_convert(
+    converters: tuple[tuple[Callable[[MessageContext, str], Any], bool], ...], ctx: MessageContext, arg: str
+) -> Any:
+    for converter, is_async in converters:
         try:
-            greedy_arg, used_default = await _convert(param, ctx, arg)
+            converted = converter(ctx, arg)
+            if is_async:
+                converted = await converted
+            return converted
+        except Exception:  # noqa
+            continue
+
+    return _FAIL
+
+
+def _get_union_convert(param: CommandParameter) -> _ConvertFunction:
+    # like with single converters, everything about the union is known beforehand
+    converters = tuple(param.converters)
+    optional = param.optional
+    default = param.default
+    union_types_str = param._union_types_str
+
+    async def convert(ctx: MessageContext, arg: str) -> tuple[Any, bool]:
+        converted = await _try_convert(converters, ctx, arg)
+
+        if converted is not _FAIL:
+            return converted, False
 
-            if used_default:
-                raise BadArgument
+        if optional:
+            return default, True
 
-            greedy_args.append(greedy_arg)
-        except BadArgument:
-            broke_off = True
+        raise BadArgument(f'Could not convert "{arg}" into {union_types_str}.')
+
+    return convert
+
+
+async def _greedy_convert(
+    param: CommandParameter,
+    converters: tuple[tuple[Callable[[MessageContext, str], Any], bool], ...],
+    ctx: MessageContext,
+    args: list[str],
+    index: int,
+) -> tuple[list[Any] | Any, int]:
+    # index is the first argument to try, and the returned index is the first argument
+    # that wasn't consumed
+    greedy_args = []
+    num_args = len(args)
+
+    while index < num_args:
+        greedy_arg = await _try_convert(converters, ctx, args[index])
+        if greedy_arg is _FAIL:
             break
 
+        greedy_args.append(greedy_arg)
+        index += 1
+
     if not greedy_args:
         if param.default:
             greedy_args = param.default  # im sorry, typehinters
         else:
             raise BadArgument(f"Failed to find any arguments for {repr(param.type)}.")
 
-    return greedy_args, broke_off
+    return greedy_args, index
+
+
+def _may_wait(converter: Callable[[MessageContext, str], Any], is_async: bool) -> bool:
+    # literal converters are async, but never actually wait on anything
+    return is_async and not isinstance(getattr(converter, "__self__", None), LiteralConverter)
+
 
+async def _convert_concurrently(convert: _ConvertFunction, ctx: MessageContext, args: list[str]) -> tuple[Any, ...]:
+    tasks = [asyncio.ensure_future(convert(ctx, arg)) for arg in args]
+    positions = {task: position for position, task in enumerate(tasks)}
+    first_failed = len(tasks)
 
-@define()
+    try:
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                if task.exception() is not None:
+                    first_failed = min(first_failed, positions[task])
+
+            # like converting one by one, the error to raise is the one for the first bad argument
+            # so anything after the first failure so far can't matter anymore
+            for task in tasks[first_failed + 1 :]:
+                task.cancel()
+            pending = {task for task in pending if positions[task] < first_failed}
+
+        if first_failed < len(tasks):
+            raise tasks[first_failed].exception()  # type: ignore
+        return tuple(task.result()[0] for task in tasks)
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled():
+                task.exception()  # marks the exception as retrieved, so asyncio doesn't log it
+
+
+# a stage handles the current argument for one parameter
+# index is the index of the argument after the current one, and a stage returns
+# the new index and if the argument was used up (so the parser should move onto the next one)
+_Stage = Callable[
+    [MessageContext, list[str], int, str, list[Any], dict[str, Any]], Coroutine[Any, Any, tuple[int, bool]]
+]
+
+
+def _get_convert(param: CommandParameter) -> _ConvertFunction:
+    return _get_union_convert(param) if param.union else _get_single_convert(param)
+
+
+def _get_stage(param: CommandParameter, position: int, convert: _ConvertFunction, concurrent: bool) -> _Stage:
+    # what a parameter does with an argument never changes, so we decide that once here
+    # rather than checking every flag of the parameter for every argument
+
+    if param.consume_rest:
+
+        async def stage(
+            ctx: MessageContext, args: list[str], index: int, arg: str, new_args: list, kwargs: dict
+        ) -> tuple[int, bool]:
+            kwargs[param.name], used_default = await convert(ctx, " ".join(args[index - 1 :]))
+            return len(args), not used_default
+
+    elif param.variable and not param.union and param.converters[0][0] is _convert_to_str:
+        # the arguments are already strings, so there's nothing to convert
+
+        async def stage(
+            ctx: MessageContext, args: list[str], index: int, arg: str, new_args: list, kwargs: dict
+        ) -> tuple[int, bool]:
+            new_args[position] = tuple(args[index - 1 :])
+            return len(args), True
+
+    elif (
+        concurrent
+        and param.variable
+        and any(_may_wait(converter, is_async) for converter, is_async in param.converters)
+    ):
+        # each argument is converted independently, so if the command allows it, converters
+        # that may be doing lookups can all run at the same time rather than one after another
+
+        async def stage(
+            ctx: MessageContext, args: list[str], index: int, arg: str, new_args: list, kwargs: dict
+        ) -> tuple[int, bool]:
+            new_args[position] = await _convert_concurrently(convert, ctx, args[index - 1 :])
+            return len(args), True
+
+    elif param.variable:
+
+        async def stage(
+            ctx: MessageContext, args: list[str], index: int, arg: str, new_args: list, kwargs: dict
+        ) -> tuple[int, bool]:
+            new_args[position] = tuple([(await convert(ctx, a))[0] for a in args[index - 1 :]])
+            return len(args), True
+
+    elif param.greedy:
+        converters = tuple(param.converters)
+
+        async def stage(
+            ctx: MessageContext, args: list[str], index: int, arg: str, new_args: list, kwargs: dict
+        ) -> tuple[int, bool]:
+            new_args[position], index = await _greedy_convert(param, converters, ctx, args, index - 1)
+            return index, not param.default
+
+    else:
+
+        async def stage(
+            ctx: MessageContext, args: list[str], index: int, arg: str, new_args: list, kwargs: dict
+        ) -> tuple[int, bool]:
+            new_args[position], used_default = await convert(ctx, arg)
+            return index, not used_default
+
+    return stage
+
+
+# none of our fields need to be converted or validated when set after init, and
+# attrs would otherwise wrap every attribute set (like parent) to handle _type_to_converter
+@define(on_setattr=attrs.setters.NO_OP)
 class MolterCommand(MessageCommand):
     parameters: list[CommandParameter] = field(metadata=docs("The paramters of the command."), factory=list)
     aliases: list[str] = field(
@@ -361,6 +582,14 @@ class MolterCommand(MessageCommand):
         ),
         default=True,
     )
+    concurrent_conversion: bool = field(
+        metadata=docs(
+            "If `True`, the arguments of a variable (`*args`) parameter with asynchronous converters are converted at"
+            " the same time rather than one after another. Leave this off for converters with side effects, that"
+            " depend on order, or that could hit rate limits. Defaults to False."
+        ),
+        default=False,
+    )
     help: Optional[str] = field(metadata=docs("The long help text for the command."), default=None)
     brief: Optional[str] = field(metadata=docs("The short help text for the command."), default=None)
     parent: Optional["MolterCommand"] = field(metadata=docs("The parent command, if applicable."), default=None)
@@ -371,6 +600,11 @@ class MolterCommand(MessageCommand):
     _type_to_converter: dict[type, type[Converter]] = field(
         default=SNEK_OBJECT_TO_CONVERTER, converter=_merge_converters
     )
+    _stages: list[_Stage] = field(factory=list, init=False)
+    _num_positional: int = field(default=0, init=False)
+    _trivial: bool = field(default=False, init=False)
+    _simple_converts: Optional[tuple[_ConvertFunction, ...]] = field(default=None, init=False)
+    _qualified_name: Optional[str] = field(default=None, init=False)
 
     def __attrs_post_init__(self) -> None:
         super().__attrs_post_init__()  # we want checks to work
@@ -409,6 +643,9 @@ class MolterCommand(MessageCommand):
     @property
     def qualified_name(self) -> str:
         """Returns the full qualified name of this command."""
+        if self._qualified_name is not None:
+            return self._qualified_name
+
         name_deq = deque()
         command = self
 
@@ -417,7 +654,8 @@ class MolterCommand(MessageCommand):
             command = command.parent
 
         name_deq.appendleft(command.name)
-        return " ".join(name_deq)
+        self._qualified_name = " ".join(name_deq)
+        return self._qualified_name
 
     @property
     def all_commands(self) -> frozenset["MolterCommand"]:
@@ -436,7 +674,7 @@ class MolterCommand(MessageCommand):
             anno = param.type
             name = param.name
 
-            if typing.get_origin(anno) == Annotated:
+            if _get_origin(anno) == Annotated:
                 # message commands can only have two arguments in an annotation anyways
                 anno = typing.get_args(anno)[1]
 
@@ -445,7 +683,7 @@ class MolterCommand(MessageCommand):
                 if len(union_args) == 2 and param.optional:
                     anno = union_args[0]
 
-            if typing.get_origin(anno) is Literal:
+            if _get_origin(anno) is Literal:
                 # it's better to list the values it can be than display the variable name itself
                 name = "|".join(f'"{v}"' if isinstance(v, str) else str(v) for v in typing.get_args(anno))
 
@@ -493,11 +731,43 @@ class MolterCommand(MessageCommand):
             make sure to ignore it while parsing.
         """
         self.parameters = _get_params(self.callback, has_self, self._type_to_converter)
+        self._prepare_parameters()
+
+    def _prepare_parameters(self) -> None:
+        # positional parameters always come before the keyword-only one, so a parameter's
+        # index is also where its argument goes when calling the callback
+        converts = tuple(_get_convert(param) for param in self.parameters)
+        self._stages = [
+            _get_stage(param, position, convert, self.concurrent_conversion)
+            for position, (param, convert) in enumerate(zip(self.parameters, converts))
+        ]
+        self._num_positional = sum(not param.consume_rest for param in self.parameters)
+
+        # if every parameter takes one argument as-is, parsing is just slicing the arguments
+        self._trivial = all(
+            not (param.greedy or param.variable or param.consume_rest or param.union)
+            and param.converters[0][0] is _convert_to_str
+            for param in self.parameters
+        )
+
+        # if every parameter takes one argument and only the last one can fall back to its
+        # default (which would make the argument move onto the next parameter), arguments
+        # line up with parameters and can be converted directly without going through stages
+        simple = all(not (param.greedy or param.variable or param.consume_rest) for param in self.parameters)
+        simple = simple and not any(param.optional for param in self.parameters[:-1])
+        self._simple_converts = converts if simple else None
 
     def add_command(self, cmd: "MolterCommand") -> None:
         """Adds a command as a subcommand to this command."""
         cmd.parent = self  # just so we know this is a subcommand
 
+        # the qualified names of the command and everything under it have changed now
+        to_reset = [cmd]
+        while to_reset:
+            command = to_reset.pop()
+            command._qualified_name = None
+            to_reset.extend(command.all_commands)
+
         cmd_names = frozenset(self.command_dict)
         if cmd.name in cmd_names:
             raise ValueError(
@@ -548,9 +818,8 @@ class MolterCommand(MessageCommand):
             return cmd
 
         for name in names[1:]:
-            try:
-                cmd = cmd.command_dict[name]
-            except (AttributeError, KeyError):
+            cmd = cmd.command_dict.get(name)
+            if cmd is None:
                 return None
 
         return cmd
@@ -567,6 +836,7 @@ class MolterCommand(MessageCommand):
         hidden: bool = False,
         ignore_extra: bool = True,
         hierarchical_checking: bool = True,
+        concurrent_conversion: bool = False,
         type_to_converter: Optional[dict[type, type[Converter]]] = None,
     ) -> (Callable[..., "MolterCommand"]):
         """
@@ -607,6 +877,13 @@ class MolterCommand(MessageCommand):
             this command's checks before its own. Otherwise, only the
             subcommand's checks are checked. Defaults to True.
 
+            concurrent_conversion (`bool`, optional): If `True`, the
+            arguments of a variable (`*args`) parameter with asynchronous
+            converters are converted at the same time rather than one
+            after another. Leave this off for converters with side effects,
+            that depend on order, or that could hit rate limits.
+            Defaults to False.
+
             type_to_converter (`dict[type, type[Converter]]`, optional): A dict
             that associates converters for types. This allows you to use
             native type annotations without needing to use `typing.Annotated`.
@@ -629,6 +906,7 @@ class MolterCommand(MessageCommand):
                 hidden=hidden,
                 ignore_extra=ignore_extra,
                 hierarchical_checking=hierarchical_checking,
+                concurrent_conversion=concurrent_conversion,
                 type_to_converter=type_to_converter or getattr(func, "_type_to_converter", {}),  # type: ignore
             )
             cmd.parse_parameters(has_self=_is_nested(func))
@@ -646,66 +924,65 @@ class MolterCommand(MessageCommand):
             ctx (`dis_snek.MessageContext`): The context to use for this command.
         """
         # sourcery skip: remove-empty-nested-block, remove-redundant-if, remove-unnecessary-else
-        if len(self.parameters) == 0:
+        stages = self._stages
+        if not stages:
             return await callback(ctx)
         else:
+            # content_parameters is a property that rebuilds the string every time
+            content_parameters = ctx.content_parameters
+
             # this is slightly costly, but probably worth it
-            ctx.args = ARGS_PARSE.findall(ctx.content_parameters)
+            raw_args = ctx.args = ARGS_PARSE.findall(content_parameters)
 
-            new_args: list[Any] = []
+            new_args: list[Any] = [None] * self._num_positional
             kwargs: dict[str, Any] = {}
-            args = ArgsIterator(tuple(_arg_fix(a) for a in ctx.args))
-            param_index = 0
-
-            for arg in args:
-                while param_index < len(self.parameters):
-                    param = self.parameters[param_index]
-
-                    if param.consume_rest:
-                        arg = " ".join(args.consume_rest())
 
-                    if param.variable:
-                        args_to_convert = args.consume_rest()
-                        new_arg = [await _convert(param, ctx, arg) for arg in args_to_convert]
-                        new_arg = tuple(arg[0] for arg in new_arg)
-                        new_args.append(new_arg)
-                        param_index += 1
-                        break
+            # most invocations don't quote anything, so there's nothing to fix
+            # searching the whole content at once in C beats checking every argument
+            # and if there's nothing to fix, the parsed arguments can be used as they are
+            if _QUOTE_SEARCH.search(content_parameters):
+                args = [_arg_fix(a) for a in raw_args]
+            else:
+                args = raw_args
+            num_args = len(args)
+            index = 0
+            param_index = 0
 
-                    if param.greedy:
-                        greedy_args, broke_off = await _greedy_convert(param, ctx, args)
+            num_params = len(stages)
 
-                        new_args.append(greedy_args)
-                        param_index += 1
-                        if broke_off:
-                            args.back()
+            if self._trivial:
+                param_index = min(num_args, num_params)
+                new_args[:param_index] = args[:param_index]
+                index = num_args
+            elif converts := self._simple_converts:
+                param_index = min(num_args, num_params)
+                for position in range(param_index):
+                    new_args[position], _ = await converts[position](ctx, args[position])
+                index = num_args
 
-                        if param.default:
-                            continue
-                        else:
-                            break
+            while index < num_args:
+                arg = args[index]
+                index += 1
 
-                    converted, used_default = await _convert(param, ctx, arg)
-                    if not param.consume_rest:
-                        new_args.append(converted)
-                    else:
-                        kwargs[param.name] = converted
+                while param_index < num_params:
+                    stage = stages[param_index]
                     param_index += 1
 
-                    if not used_default:
+                    index, used_arg = await stage(ctx, args, index, arg, new_args, kwargs)
+                    if used_arg:
                         break
 
-            if param_index < len(self.parameters):
-                for param in self.parameters[param_index:]:
+            if param_index < num_params:
+                for position, param in enumerate(self.parameters[param_index:], start=param_index):
                     if not param.optional:
                         raise BadArgument(f"{param.name} is a required argument that is missing.")
                     else:
                         if not param.consume_rest:
-                            new_args.append(param.default)
+                            new_args[position] = param.default
                         else:
                             kwargs[param.name] = param.default
                             break
-            elif not self.ignore_extra and not args.finished:
+            elif not self.ignore_extra and index < num_args:
                 raise BadArgument(f"Too many arguments passed to {self.name}.")
 
             return await callback(ctx, *new_args, **kwargs)
@@ -722,6 +999,7 @@ def message_command(
     hidden: bool = False,
     ignore_extra: bool = True,
     hierarchical_checking: bool = True,
+    concurrent_conversion: bool = False,
     type_to_converter: Optional[dict[type, type[Converter]]] = None,
 ) -> Callable[..., MolterCommand]:
     """
@@ -762,6 +1040,13 @@ def message_command(
         this command's checks before its own. Otherwise, only the
         subcommand's checks are checked. Defaults to True.
 
+        concurrent_conversion (`bool`, optional): If `True`, the
+        arguments of a variable (`*args`) parameter with asynchronous
+        converters are converted at the same time rather than one
+        after another. Leave this off for converters with side effects,
+        that depend on order, or that could hit rate limits.
+        Defaults to False.
+
         type_to_converter (`dict[type, type[Converter]]`, optional): A dict
         that associates converters for types. This allows you to use
         native type annotations without needing to use `typing.Annotated`.
@@ -784,6 +1069,7 @@ def message_command(
             hidden=hidden,
             ignore_extra=ignore_extra,
             hierarchical_checking=hierarchical_checking,
+            concurrent_conversion=concurrent_conversion,
             type_to_converter=type_to_converter or getattr(func, "_type_to_converter", {}),  # type: ignore
         )
         cmd.parse_parameters(has_self=_is_nested(func))
@@ -825,17 +1111,20 @@ def register_converter(anno_type: type, converter: type[Converter]) -> Callable[
             # to use the provided converter without re-analyzing every param
             for param in command.parameters:
                 param_type = param.type
+
                 if anno_type == param_type:
-                    param.converters = [converter]
+                    param.converters = [_get_converter_function(converter, param.name)]
                 else:
-                    if typing.get_origin(param_type) == Annotated:
+                    if _get_origin(param_type) == Annotated:
                         param_type = _get_from_anno_type(param_type, param.name)
 
                     with suppress(ValueError):
                         # if you have multiple of the same anno/type here, i don't know
                         # what to tell you other than why
                         index = typing.get_args(param.type).index(anno_type)
-                        param.converters[index] = converter
+                        param.converters[index] = _get_converter_function(converter, param.name)
+
+            command._prepare_parameters()
 
         return command
 
@@ -1,5 +1,10 @@
+import asyncio
+import functools
 import re
+import time
 import typing  # importing functions/decorators directly is weird
+import weakref
+from collections import OrderedDict
 from typing import TypeVar, Protocol, Any, Optional, List
 
 from dis_snek.client.errors import Forbidden, HTTPException
@@ -74,58 +79,135 @@ T_co = TypeVar("T_co", covariant=True)
 
 @typing.runtime_checkable
 class Converter(Protocol[T_co]):
+    __slots__ = ()
+
     async def convert(self, ctx: Context, argument: Any) -> T_co:
         raise NotImplementedError("Derived classes need to implement this.")
 
 
+@functools.lru_cache(maxsize=None)
+def _is_converter_class(cls: type) -> bool:
+    return isinstance(cls, Converter)
+
+
+def _is_converter(obj: Any) -> bool:
+    # isinstance checks against a runtime protocol inspect the object's attributes every time,
+    # and the same handful of classes get checked over and over when commands are made
+    # instances aren't cached as they may not be hashable, and we don't want to keep them alive
+    return _is_converter_class(obj) if isinstance(obj, type) else isinstance(obj, Converter)
+
+
 class LiteralConverter(Converter):
+    __slots__ = ("values", "_str_literals", "_literals_by_type", "_literals_str")
+
     values: dict
 
     def __init__(self, args: Any) -> None:
         self.values = {arg: type(arg) for arg in args}
 
+        # arguments are strings already, so string literals can be checked for directly
+        self._str_literals = frozenset(arg for arg, arg_type in self.values.items() if arg_type is str)
+
+        # other literals usually share a handful of types, so rather than converting the argument
+        # for every literal, we convert it once per type and see if that's one of the literals
+        self._literals_by_type: dict[type, frozenset] = {
+            converter: frozenset(arg for arg, arg_type in self.values.items() if arg_type is converter)
+            for converter in self.values.values()
+            if converter is not str
+        }
+
+        literals_list = [str(a) for a in self.values.keys()]
+        if len(literals_list) > 1:
+            self._literals_str = ", ".join(literals_list[:-1]) + f", or {literals_list[-1]}"
+        else:
+            self._literals_str = literals_list[0]
+
     async def convert(self, ctx: Context, argument: str) -> Any:
-        for arg, converter in self.values.items():
+        if argument in self._str_literals:
+            return argument
+
+        for converter, literals in self._literals_by_type.items():
             try:
-                if arg == converter(argument):
+                if converter(argument) in literals:
                     return argument
             except Exception:  # noqa
                 continue
 
-        literals_list = [str(a) for a in self.values.keys()]
-        literals_str = ", ".join(literals_list[:-1]) + f", or {literals_list[-1]}"
-        raise BadArgument(f'Could not convert "{argument}" into one of {literals_str}.')
+        raise BadArgument(f'Could not convert "{argument}" into one of {self._literals_str}.')
+
+
+_ID_REGEX = re.compile(r"([0-9]{15,})", re.ASCII)
+_EMOJI_REGEX = re.compile(r"<(a)?:([a-zA-Z0-9\_]{1,32}):([0-9]{15,})>", re.ASCII)
+
+
+def _id_or_mention_regex(mention: str) -> re.Pattern[str]:
+    # one regex that matches either a raw id or the mention, with the id being the last group that matched
+    return re.compile(rf"([0-9]{{15,}})|{mention}", re.ASCII)
 
 
-_ID_REGEX = re.compile(r"([0-9]{15,})$")
+_SNOWFLAKE_REGEX = _id_or_mention_regex(r"<(?:@(?:!|&)?|#)([0-9]{15,})>")
+_USER_REGEX = _id_or_mention_regex(r"<@!?([0-9]{15,})>")
+_CHANNEL_REGEX = _id_or_mention_regex(r"<#([0-9]{15,})>")
+_ROLE_REGEX = _id_or_mention_regex(r"<@&([0-9]{15,})>")
+_CUSTOM_EMOJI_REGEX = _id_or_mention_regex(r"<a?:[a-zA-Z0-9\_]{1,32}:([0-9]{15,})>")
 
 
 class IDConverter(Converter[T_co]):
+    __slots__ = ()
+
     @staticmethod
     def _get_id_match(argument: str) -> Optional[re.Match[str]]:
-        return _ID_REGEX.match(argument)
+        if len(argument) < 15 or not argument.isdigit():
+            return None  # names are common arguments, and this is much cheaper than the regex
+        return _ID_REGEX.fullmatch(argument)
+
+    @staticmethod
+    def _get_id(argument: str, regex: re.Pattern[str]) -> Optional[int]:
+        # all mentions start with <, so anything else has to be an id to match
+        # and we can tell if something's an id without the regex
+        if argument[:1] != "<":
+            return int(argument) if len(argument) >= 15 and argument.isascii() and argument.isdigit() else None
+        match = regex.fullmatch(argument)
+        return int(match.group(match.lastindex)) if match else None  # type: ignore
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_snowflake(argument: str) -> Optional[int]:
+    # the same ids and mentions tend to get passed over and over, and parsing them never changes
+    return IDConverter._get_id(argument, _SNOWFLAKE_REGEX)
 
 
 class SnowflakeConverter(IDConverter[SnowflakeObject]):
+    __slots__ = ()
+
     async def convert(self, ctx: Context, argument: str) -> SnowflakeObject:
-        match = self._get_id_match(argument) or re.match(r"<(?:@(?:!|&)?|#)([0-9]{15,})>$", argument)
+        snowflake_id = _parse_snowflake(argument)
 
-        if match is None:
+        if snowflake_id is None:
             raise BadArgument(argument)
 
-        return SnowflakeObject(int(match.group(1)))  # type: ignore
+        return SnowflakeObject(id=snowflake_id)  # type: ignore
+
+
+# ChannelTypes is an IntEnum, so this works for it and for raw ints
+_VOICE_CHANNEL_TYPES = frozenset({ChannelTypes.GUILD_VOICE, ChannelTypes.GUILD_STAGE_VOICE})
 
 
 class ChannelConverter(IDConverter[T_co]):
+    __slots__ = ()
+
+    # most channel converters only differ by the type of channel they accept
+    _check_type: type[BaseChannel] = BaseChannel
+
     def _check(self, result: BaseChannel) -> bool:
-        return True
+        return isinstance(result, self._check_type)
 
     async def convert(self, ctx: Context, argument: str) -> T_co:
-        match = self._get_id_match(argument) or re.match(r"<#([0-9]{15,})>$", argument)
+        channel_id = self._get_id(argument, _CHANNEL_REGEX)
         result = None
 
-        if match:
-            result = await ctx.bot.fetch_channel(int(match.group(1)))
+        if channel_id is not None:
+            result = await ctx.bot.fetch_channel(channel_id)
         elif ctx.guild:
             result = next((c for c in ctx.guild.channels if c.name == argument), None)
         else:
@@ -141,95 +223,108 @@ class ChannelConverter(IDConverter[T_co]):
 
 
 class BaseChannelConverter(ChannelConverter[BaseChannel]):
-    pass
+    __slots__ = ()
 
 
 class DMChannelConverter(ChannelConverter[DMChannel]):
-    def _check(self, result: BaseChannel) -> bool:
-        return isinstance(result, DMChannel)
+    __slots__ = ()
+
+    _check_type = DMChannel
 
 
 class DMConverter(ChannelConverter[DM]):
-    def _check(self, result: BaseChannel) -> bool:
-        return isinstance(result, DM)
+    __slots__ = ()
+
+    _check_type = DM
 
 
 class DMGroupConverter(ChannelConverter[DMGroup]):
-    def _check(self, result: BaseChannel) -> bool:
-        return isinstance(result, DMGroup)
+    __slots__ = ()
+
+    _check_type = DMGroup
 
 
 class GuildChannelConverter(ChannelConverter[GuildChannel]):
-    def _check(self, result: BaseChannel) -> bool:
-        return isinstance(result, GuildChannel)
+    __slots__ = ()
+
+    _check_type = GuildChannel
 
 
 class GuildNewsConverter(ChannelConverter[GuildNews]):
-    def _check(self, result: BaseChannel) -> bool:
-        return isinstance(result, GuildNews)
+    __slots__ = ()
+
+    _check_type = GuildNews
 
 
 class GuildCategoryConverter(ChannelConverter[GuildCategory]):
-    def _check(self, result: BaseChannel) -> bool:
-        return isinstance(result, GuildCategory)
+    __slots__ = ()
+
+    _check_type = GuildCategory
 
 
 class GuildTextConverter(ChannelConverter[GuildText]):
-    def _check(self, result: BaseChannel) -> bool:
-        return isinstance(result, GuildText)
+    __slots__ = ()
+
+    _check_type = GuildText
 
 
 class ThreadChannelConverter(ChannelConverter[ThreadChannel]):
-    def _check(self, result: BaseChannel) -> bool:
-        return isinstance(result, ThreadChannel)
+    __slots__ = ()
+
+    _check_type = ThreadChannel
 
 
 class GuildNewsThreadConverter(ChannelConverter[GuildNewsThread]):
-    def _check(self, result: BaseChannel) -> bool:
-        return isinstance(result, GuildNewsThread)
+    __slots__ = ()
+
+    _check_type = GuildNewsThread
 
 
 class GuildPublicThreadConverter(ChannelConverter[GuildPublicThread]):
-    def _check(self, result: BaseChannel) -> bool:
-        return isinstance(result, GuildPublicThread)
+    __slots__ = ()
+
+    _check_type = GuildPublicThread
 
 
 class GuildPrivateThreadConverter(ChannelConverter[GuildPrivateThread]):
-    def _check(self, result: BaseChannel) -> bool:
-        return isinstance(result, GuildPrivateThread)
+    __slots__ = ()
+
+    _check_type = GuildPrivateThread
 
 
 class GuildVoiceConverter(ChannelConverter[GuildVoice]):
-    def _check(self, result: BaseChannel) -> bool:
-        return isinstance(result, GuildVoice)
+    __slots__ = ()
+
+    _check_type = GuildVoice
 
 
 class GuildStageVoiceConverter(ChannelConverter[GuildStageVoice]):
-    def _check(self, result: BaseChannel) -> bool:
-        return isinstance(result, GuildStageVoice)
+    __slots__ = ()
+
+    _check_type = GuildStageVoice
 
 
 class MessageableChannelConverter(ChannelConverter[TYPE_MESSAGEABLE_CHANNEL]):
+    __slots__ = ()
+
     def _check(self, result: BaseChannel) -> bool:
-        return (isinstance(result.type, ChannelTypes) and not result.type.voice) or result.type not in {
-            2,
-            13,
-        }
+        return result.type not in _VOICE_CHANNEL_TYPES
 
 
 class UserConverter(IDConverter[User]):
+    __slots__ = ()
+
     async def convert(self, ctx: Context, argument: str) -> User:
-        match = self._get_id_match(argument) or re.match(r"<@!?([0-9]{15,})>$", argument)
+        user_id = self._get_id(argument, _USER_REGEX)
         result = None
 
-        if match:
-            result = await ctx.bot.fetch_user(int(match.group(1)))
+        if user_id is not None:
+            result = await ctx.bot.fetch_user(user_id)
+        elif argument[-5:-4] == "#":
+            # usernames can't have a # in them, so if there's no match for the tag, there's no match at all
+            result = next((u for u in ctx.bot.cache.user_cache.values() if u.tag == argument), None)
         else:
-            if len(argument) > 5 and argument[-5] == "#":
-                result = next((u for u in ctx.bot.cache.user_cache.values() if u.tag == argument), None)
-
-            if not result:
-                result = next((u for u in ctx.bot.cache.user_cache.values() if u.username == argument), None)
+            result = next((u for u in ctx.bot.cache.user_cache.values() if u.username == argument), None)
 
         if not result:
             raise BadArgument(f'User "{argument}" not found.')
@@ -237,35 +332,90 @@ class UserConverter(IDConverter[User]):
         return result
 
 
+# searching members is an api call, and the same search tends to be made a few times in a row
+# (or at the same time), so searches are shared and their results kept around for a bit
+# - see MemberConverter.search_cache_ttl for how long, and what that means for results
+# searches are futures, which only work on the loop that made them, so each loop gets its own cache
+# and a cache only holds the _MEMBER_SEARCH_MAX most recently used searches
+_MEMBER_SEARCH_MAX = 256
+# {loop: {(guild_id, query): (time made, search)}}
+_member_searches: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+async def _search_members(guild: Guild, query: str, ttl: float) -> list[Member]:
+    loop = asyncio.get_running_loop()
+    searches = _member_searches.get(loop)
+    if searches is None:
+        searches = _member_searches[loop] = OrderedDict()
+
+    key = (guild.id, query)
+    now = time.monotonic()
+
+    entry = searches.get(key)
+    if entry and now - entry[0] < ttl:
+        future = entry[1]
+        searches.move_to_end(key)
+    else:
+        future = asyncio.ensure_future(guild.search_members(query, limit=100))
+        searches[key] = (now, future)
+        searches.move_to_end(key)
+        while len(searches) > _MEMBER_SEARCH_MAX:
+            searches.popitem(last=False)
+
+        def evict_failed(future: asyncio.Future) -> None:
+            # a failed or cancelled search shouldn't be handed out again
+            if (future.cancelled() or future.exception() is not None) and searches.get(key, (None, None))[1] is future:
+                del searches[key]
+
+        future.add_done_callback(evict_failed)
+
+    # shielded so one cancelled command doesn't cancel the search for everyone else
+    # and copied so one caller changing the list doesn't change it for the others
+    return list(await asyncio.shield(future))
+
+
 class MemberConverter(IDConverter[Member]):
-    def _get_member_from_list(self, members: list[Member], argument: str) -> Optional[Member]:
-        # sourcery skip: assign-if-exp
-        result = None
-        if len(argument) > 5 and argument[-5] == "#":
-            result = next((m for m in members if m.user.tag == argument), None)
+    __slots__ = ()
 
-        if not result:
-            result = next((m for m in members if m.display_name == argument or m.user.username == argument), None)
+    search_cache_ttl: typing.ClassVar[float] = 30
+    """
+    How long, in seconds, a search for members by name is reused for in guilds that aren't chunked.
 
-        return result
+    Members who join after a search was made won't be found by name until it expires.
+    Set this to 0 to always search.
+    """
+
+    def _get_member_from_list(self, members: list[Member], argument: str) -> Optional[Member]:
+        if argument[-5:-4] == "#":
+            # usernames can't have a # in them, so this can only be a tag or a nickname
+            # tags take priority, but we can look for both at once rather than going over the list twice
+            nick_match = None
+            for member in members:
+                if member.user.tag == argument:
+                    return member
+                if nick_match is None and member.display_name == argument:
+                    nick_match = member
+            return nick_match
+
+        return next((m for m in members if m.display_name == argument or m.user.username == argument), None)
 
     async def convert(self, ctx: Context, argument: str) -> Member:
         if not ctx.guild:
             raise BadArgument("This command cannot be used in private messages.")
 
-        match = self._get_id_match(argument) or re.match(r"<@!?([0-9]{15,})>$", argument)
+        member_id = self._get_id(argument, _USER_REGEX)
         result = None
 
-        if match:
-            result = await ctx.guild.fetch_member(int(match.group(1)))
+        if member_id is not None:
+            result = await ctx.guild.fetch_member(member_id)
         elif ctx.guild.chunked:
             result = self._get_member_from_list(ctx.guild.members, argument)
         else:
             query = argument
-            if len(argument) > 5 and argument[-5] == "#":
+            if argument[-5:-4] == "#":
                 query, _, _ = argument.rpartition("#")
 
-            members = await ctx.guild.search_members(query, limit=100)
+            members = await _search_members(ctx.guild, query, self.search_cache_ttl)
             result = self._get_member_from_list(members, argument)
 
         if not result:
@@ -274,27 +424,35 @@ class MemberConverter(IDConverter[Member]):
         return result
 
 
+# either just the id or <chan_id>-<mes_id>, a format you can get by shift clicking "copy id"
+_MESSAGE_ID_REGEX = re.compile(r"(?:(?P<channel_id>[0-9]{15,})-)?(?P<message_id>[0-9]{15,})", re.ASCII)
+# of course, having a way to get it from a link is nice
+_MESSAGE_LINK_REGEX = re.compile(
+    r"https?://(?:[^/\s]*\.)?discord(?:app)?\.com/channels/(?P<guild_id>[0-9]{15,}|@me)/(?P<channel_id>[0-9]{15,})/(?P<message_id>[0-9]{15,})/?",
+    re.ASCII,
+)
+
+
 class MessageConverter(Converter[Message]):
-    # either just the id or <chan_id>-<mes_id>, a format you can get by shift clicking "copy id"
-    _ID_REGEX = re.compile(r"(?:(?P<channel_id>[0-9]{15,})-)?(?P<message_id>[0-9]{15,})")
-    # of course, having a way to get it from a link is nice
-    _MESSAGE_LINK_REGEX = re.compile(
-        r"https?://[\S]*?discord(?:app)?\.com/channels/(?P<guild_id>[0-9]{15,}|@me)/(?P<channel_id>[0-9]{15,})/(?P<message_id>[0-9]{15,})\/?$"
-    )
+    __slots__ = ()
 
     async def convert(self, ctx: Context, argument: str) -> Message:
-        match = self._ID_REGEX.match(argument) or self._MESSAGE_LINK_REGEX.match(argument)
+        # the two formats can't be mistaken for each other, so only one regex needs to be tried
+        if argument.startswith(("http://", "https://")):
+            match = _MESSAGE_LINK_REGEX.fullmatch(argument)
+        else:
+            match = _MESSAGE_ID_REGEX.fullmatch(argument)
         if not match:
             raise BadArgument(f'Message "{argument}" not found.')
 
-        data = match.groupdict()
-
-        message_id = data["message_id"]
-        channel_id = int(data["channel_id"]) if data.get("channel_id") else ctx.channel.id
+        message_id = match.group("message_id")
+        channel_id = match.group("channel_id")
+        channel_id = int(channel_id) if channel_id else ctx.channel.id
 
         # this guild checking is technically unnecessary, but we do it just in case
         # it means a user cant just provide an invalid guild id and still get a message
-        guild_id = data["guild_id"] if data.get("guild_id") else ctx.guild_id
+        # only links have a guild id
+        guild_id = match.group("guild_id") if "guild_id" in match.re.groupindex else ctx.guild_id
         guild_id = int(guild_id) if guild_id != "@me" else None
 
         try:
@@ -310,6 +468,8 @@ class MessageConverter(Converter[Message]):
 
 
 class GuildConverter(IDConverter[Guild]):
+    __slots__ = ()
+
     async def convert(self, ctx: Context, argument: str) -> Guild:
         match = self._get_id_match(argument)
         result = None
@@ -326,15 +486,17 @@ class GuildConverter(IDConverter[Guild]):
 
 
 class RoleConverter(IDConverter[Role]):
+    __slots__ = ()
+
     async def convert(self, ctx: Context, argument: str) -> Role:
         if not ctx.guild:
             raise BadArgument("This command cannot be used in private messages.")
 
-        match = self._get_id_match(argument) or re.match(r"<@&([0-9]{15,})>$", argument)
+        role_id = self._get_id(argument, _ROLE_REGEX)
         result = None
 
-        if match:
-            result = await ctx.guild.fetch_role(int(match.group(1)))
+        if role_id is not None:
+            result = await ctx.guild.fetch_role(role_id)
         else:
             result = next((r for r in ctx.guild.roles if r.name == argument), None)
 
@@ -345,9 +507,11 @@ class RoleConverter(IDConverter[Role]):
 
 
 class PartialEmojiConverter(IDConverter[PartialEmoji]):
+    __slots__ = ()
+
     async def convert(self, ctx: Context, argument: str) -> PartialEmoji:
 
-        if match := self._get_id_match(argument) or re.match(r"<a?:[a-zA-Z0-9\_]{1,32}:([0-9]{15,})>$", argument):
+        if argument[:1] == "<" and (match := _EMOJI_REGEX.fullmatch(argument)):
             emoji_animated = bool(match.group(1))
             emoji_name = match.group(2)
             emoji_id = int(match.group(3))
@@ -358,23 +522,27 @@ class PartialEmojiConverter(IDConverter[PartialEmoji]):
 
 
 class CustomEmojiConverter(IDConverter[CustomEmoji]):
+    __slots__ = ()
+
     async def convert(self, ctx: Context, argument: str) -> CustomEmoji:
         if not ctx.guild:
             raise BadArgument("This command cannot be used in private messages.")
 
-        match = self._get_id_match(argument) or re.match(r"<a?:[a-zA-Z0-9\_]{1,32}:([0-9]{15,})>$", argument)
+        emoji_id = self._get_id(argument, _CUSTOM_EMOJI_REGEX)
         result = None
 
-        if match:
-            result = await ctx.guild.fetch_custom_emoji(int(match.group(1)))
+        if emoji_id is not None:
+            result = await ctx.guild.fetch_custom_emoji(emoji_id)
         else:
             if ctx.bot.cache.enable_emoji_cache:
+                # the emoji cache has every guild's emojis in it, but we only want this one's
+                guild_id = ctx.guild.id
                 emojis = ctx.bot.cache.emoji_cache.values()  # type: ignore
-                result = next((e for e in emojis if e.name == argument))
+                result = next((e for e in emojis if e.name == argument and e._guild_id == guild_id), None)
 
             if not result:
                 emojis = await ctx.guild.fetch_all_custom_emojis()
-                result = next((e for e in emojis if e.name == argument))
+                result = next((e for e in emojis if e.name == argument), None)
 
         if not result:
             raise BadArgument(f'Emoji "{argument}" not found.')
@@ -12,7 +12,10 @@ class BadArgument(CommandException):
 
     def __init__(self, message: Optional[str] = None, *args: Any) -> None:
         if message is not None:
-            message = escape_mentions(message)
+            # every mention escape_mentions handles has an @ in it, and most messages don't,
+            # so we can skip its regex for those
+            if "@" in message:
+                message = escape_mentions(message)
             super().__init__(message, *args)
         else:
             super().__init__(*args)
@@ -1,9 +1,10 @@
+import copy
 import logging
-from typing import Optional, Iterable
+import re
+from typing import Any, Optional, Iterable
 
 from dis_snek.client.client import Snake
 from dis_snek.client.utils.input_utils import get_args
-from dis_snek.client.utils.input_utils import get_first_word
 from dis_snek.client.const import logger_name, MENTION_PREFIX
 from dis_snek.api.events.discord import MessageCreate
 from dis_snek.models.snek.scale import Scale
@@ -18,6 +19,17 @@ log = logging.getLogger(logger_name)
 
 __all__ = ("MolterScale", "MolterSnake")
 
+# equivalent to what dis-snek's get_first_word considers a word
+_WORD_REGEX = re.compile(r"\S+")
+
+
+def _as_prefix_tuple(prefixes: str | Iterable[str]) -> tuple:
+    if isinstance(prefixes, str) or prefixes == MENTION_PREFIX:
+        # its easier to treat everything as if it may be an iterable
+        # rather than building a special case for this
+        return (prefixes,)
+    return tuple(prefixes)
+
 
 class MolterScale(Scale):
     """
@@ -66,6 +78,9 @@ class MolterSnake(Snake):
     commands: dict[str, MessageCommand | MolterCommand]
     """A dictionary of registered commands: `{name: command}`"""
 
+    # (copy of default_prefix, prefixes) - see _get_static_prefixes
+    _static_prefixes: Optional[tuple[Any, tuple]] = None
+
     def add_message_command(self, command: MessageCommand | MolterCommand) -> None:
         """Add a message command to the client.
 
@@ -80,11 +95,20 @@ class MolterSnake(Snake):
 
         super().add_message_command(command)  # adds cmd.name
 
-        for alias in command.aliases:
-            if alias not in self.commands:
-                self.commands[alias] = command
-                continue
-            raise ValueError(f"Duplicate Command! Multiple commands share the name/alias `{alias}`")
+        aliases = command.aliases
+
+        # checking every alias at once also means we don't add some aliases before erroring on another
+        # the command's own name was added above, so an alias that's the same as it counts as a duplicate,
+        # and so does an alias listed more than once
+        duplicates = self.commands.keys() & aliases
+        if duplicates or len(set(aliases)) != len(aliases):
+            seen = set()
+            for alias in aliases:
+                if alias in duplicates or alias in seen:
+                    raise ValueError(f"Duplicate Command! Multiple commands share the name/alias `{alias}`")
+                seen.add(alias)
+
+        self.commands |= dict.fromkeys(aliases, command)
 
     def get_command(self, name: str) -> Optional[MessageCommand | MolterCommand]:
         """
@@ -104,17 +128,57 @@ class MolterSnake(Snake):
             return None
 
         cmd = self.commands.get(names[0])
-        if not cmd or not isinstance(cmd, MolterCommand):
-            return cmd
 
         for name in names[1:]:
-            try:
-                cmd = cmd.command_dict[name]
-            except (AttributeError, KeyError):
+            # normal message commands can't have subcommands
+            if not isinstance(cmd, MolterCommand):
+                return None
+            cmd = cmd.command_dict.get(name)
+            if cmd is None:
                 return None
 
         return cmd
 
+    def _get_static_prefixes(self) -> Optional[tuple]:
+        """
+        Get the prefixes to use if they can be known without calling `generate_prefixes`.
+
+        This is only the case if `generate_prefixes` is the default one, which just returns `default_prefix`.
+        """
+        if getattr(self.generate_prefixes, "__func__", None) is not Snake.generate_prefixes:
+            return None
+
+        # default_prefix can be changed in place (like appending to a list of prefixes), so we compare
+        # it to a copy of what it was - a cheap comparison for the few prefixes bots tend to have
+        default_prefix = self.default_prefix
+        if self._static_prefixes and self._static_prefixes[0] == default_prefix:
+            return self._static_prefixes[1]
+
+        prefixes = _as_prefix_tuple(default_prefix)
+        self._static_prefixes = (copy.copy(default_prefix), prefixes)
+        return prefixes
+
+    def _find_prefix(self, content: str, prefixes: tuple[str, ...]) -> Optional[str]:
+        """Find the first prefix in the prefixes given that the content starts with, if any."""
+        if MENTION_PREFIX not in prefixes:
+            # most messages aren't commands, and startswith can check every prefix at once in C
+            # so we only need to go through the prefixes one by one if one of them is used
+            if not content.startswith(prefixes):
+                return None
+            return next(prefix for prefix in prefixes if content.startswith(prefix))
+
+        for prefix in prefixes:
+            if prefix == MENTION_PREFIX:
+                # the mention regex is anchored, so a match already means the content starts with it
+                if mention := self._mention_reg.match(content):  # type: ignore
+                    return mention.group()
+                continue
+
+            if content.startswith(prefix):
+                return prefix
+
+        return None
+
     @listen("message_create")
     async def _dispatch_msg_commands(self, event: MessageCreate) -> None:
         """
@@ -124,78 +188,63 @@ class MolterSnake(Snake):
         """
         message = event.message
 
-        if not message.content:
+        # most messages aren't commands, so get rid of the ones that obviously can't be as soon as possible
+        if not message.content or message.author.bot:
             return
 
-        if not message.author.bot:
-            prefixes: str | Iterable[str] = await self.generate_prefixes(self, message)
-
-            if isinstance(prefixes, str) or prefixes == MENTION_PREFIX:
-                # its easier to treat everything as if it may be an iterable
-                # rather than building a special case for this
-                prefixes = (prefixes,)  # type: ignore
-
-            prefix_used = None
-
-            for prefix in prefixes:
-                if prefix == MENTION_PREFIX:
-                    if mention := self._mention_reg.search(message.content):  # type: ignore
-                        prefix = mention.group()
-                    else:
-                        continue
+        # most bots don't use dynamic prefixes, so theres no need to await anything for them
+        prefixes = self._get_static_prefixes()
+        if prefixes is None:
+            prefixes = _as_prefix_tuple(await self.generate_prefixes(self, message))
+
+        prefix_used = self._find_prefix(message.content, prefixes)
+
+        if prefix_used:
+            context = await self.get_context(message)
+            context.prefix = prefix_used
+
+            # interestingly enough, we cannot count on ctx.invoked_name
+            # being correct as its hard to account for newlines and the like
+            # with the way we get subcommands here
+            # we'll have to reconstruct it ourselves - rather than cutting the content
+            # down after every word, we keep track of where in the content we are,
+            # so the invoked name is everything between the prefix and that position
+            content = message.content
+            pos = len(prefix_used)
+            command = self
+
+            while word := _WORD_REGEX.search(content, pos):
+                first_word = word.group()
+                if isinstance(command, MolterCommand):
+                    new_command = command.command_dict.get(first_word)
+                else:
+                    new_command = command.commands.get(first_word)
+                if not new_command or not new_command.enabled:
+                    break
 
-                if message.content.startswith(prefix):
-                    prefix_used = prefix
+                command = new_command
+                pos = word.end()
+                if not isinstance(command, MolterCommand):
+                    # normal message commands can't have subcommands
                     break
 
-            if prefix_used:
-                context = await self.get_context(message)
-                context.prefix = prefix_used
-
-                # interestingly enough, we cannot count on ctx.invoked_name
-                # being correct as its hard to account for newlines and the like
-                # with the way we get subcommands here
-                # we'll have to reconstruct it by getting the content_parameters
-                # then removing the prefix and the parameters from the message
-                # content
-                content_parameters = message.content.removeprefix(prefix_used)  # type: ignore
-                command = self
-
-                while True:
-                    first_word: str = get_first_word(content_parameters)  # type: ignore
-                    if isinstance(command, MolterCommand):
-                        new_command = command.command_dict.get(first_word)
-                    else:
-                        new_command = command.commands.get(first_word)
-                    if not new_command or not new_command.enabled:
-                        break
-
-                    command = new_command
-                    content_parameters = content_parameters.removeprefix(first_word).strip()
-                    if not isinstance(command, MolterCommand):
-                        # normal message commands can't have subcommands
-                        break
-
-                    if command.command_dict and command.hierarchical_checking:
-                        await new_command._can_run(context)
-
-                if isinstance(command, Snake):
-                    command = None
-
-                if command and command.enabled:
-                    # yeah, this looks ugly
-                    context.command = command
-                    context.invoked_name = (
-                        message.content.removeprefix(prefix_used).removesuffix(content_parameters).strip()  # type: ignore
-                    )
-                    context.args = get_args(context.content_parameters)
-                    try:
-                        if self.pre_run_callback:
-                            await self.pre_run_callback(context)
-                        await self._run_message_command(command, context)
-                        if self.post_run_callback:
-                            await self.post_run_callback(context)
-                    except Exception as e:
-                        await self.on_command_error(context, e)
-                    finally:
-                        await self.on_command(context)
+                if command.command_dict and command.hierarchical_checking:
+                    await new_command._can_run(context)
+
+            if isinstance(command, Snake):
+                command = None
+
+            if command and command.enabled:
+                context.command = command
+                context.invoked_name = content[len(prefix_used) : pos].strip()
+                context.args = get_args(context.content_parameters)
+                try:
+                    if self.pre_run_callback:
+                        await self.pre_run_callback(context)
+                    await self._run_message_command(command, context)
+                    if self.post_run_callback:
+                        await self.post_run_callback(context)
+                except Exception as e:
+                    await self.on_command_error(context, e)
+                finally:
+                    await self.on_command(context)
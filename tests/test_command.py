@@ -0,0 +1,223 @@
+import asyncio
+from typing import Annotated, Literal, Optional, Union
+
+import pytest
+
+import molter
+from molter import BadArgument, Greedy
+
+
+class _Context:
+    def __init__(self, content: str) -> None:
+        self.content_parameters = content
+        self.args = []
+
+
+def _run(command: molter.MolterCommand, content: str) -> tuple[tuple, dict]:
+    result = {}
+
+    async def callback(ctx, *args, **kwargs) -> None:
+        result["args"] = args
+        result["kwargs"] = kwargs
+
+    asyncio.run(command.call_callback(callback, _Context(content)))
+    return result["args"], result["kwargs"]
+
+
+# these are equal to each other, but their types should be tried in different orders
+@molter.msg_command()
+async def int_first(ctx, a: Union[int, float]) -> None:
+    pass
+
+
+@molter.msg_command()
+async def float_first(ctx, a: Union[float, int]) -> None:
+    pass
+
+
+@molter.msg_command()
+async def x_first(ctx, a: Literal["x", "y"]) -> None:
+    pass
+
+
+@molter.msg_command()
+async def y_first(ctx, a: Literal["y", "x"]) -> None:
+    pass
+
+
+def test_union_order_is_kept() -> None:
+    (int_arg,), _ = _run(int_first, "1")
+    (float_arg,), _ = _run(float_first, "1")
+    assert type(int_arg) is int
+    assert type(float_arg) is float
+    assert float_first.parameters[0]._union_types_str == "float, or int"
+
+
+def test_literal_order_is_kept() -> None:
+    assert x_first.signature == '<"x"|"y">'
+    assert y_first.signature == '<"y"|"x">'
+
+
+@molter.msg_command()
+async def trivial(ctx, a, b: str, c="z") -> None:
+    pass
+
+
+def test_trivial_parsing() -> None:
+    assert trivial._trivial
+    assert _run(trivial, 'x "y y"') == (("x", "y y", "z"), {})
+    assert _run(trivial, "x y w v") == (("x", "y", "w"), {})
+
+    with pytest.raises(BadArgument, match="required"):
+        _run(trivial, "x")
+
+
+@molter.msg_command()
+async def simple(ctx, a: int, b: str, c: bool = False) -> None:
+    pass
+
+
+def test_simple_parsing() -> None:
+    assert simple._simple_converts is not None
+    assert _run(simple, "1 hi yes") == ((1, "hi", True), {})
+    assert _run(simple, '1 "hi there"') == ((1, "hi there", False), {})
+
+    with pytest.raises(BadArgument, match="required"):
+        _run(simple, "1")
+    with pytest.raises(BadArgument, match="invalid literal"):
+        _run(simple, "x hi")
+
+
+@molter.msg_command()
+async def optional_first(ctx, a: Optional[int], b: str) -> None:
+    pass
+
+
+def test_optional_falls_through() -> None:
+    assert optional_first._simple_converts is None
+    assert _run(optional_first, "x y") == ((None, "x"), {})
+    assert _run(optional_first, "3 y") == ((3, "y"), {})
+
+
+@molter.msg_command()
+async def consume_rest(ctx, a: int, *, rest: str) -> None:
+    pass
+
+
+@molter.msg_command()
+async def consume_rest_default(ctx, a, *, rest: str = "d") -> None:
+    pass
+
+
+def test_consume_rest() -> None:
+    assert _run(consume_rest, "1 hello world  x") == ((1,), {"rest": "hello world x"})
+    assert _run(consume_rest_default, "x") == (("x",), {"rest": "d"})
+
+
+@molter.msg_command()
+async def greedy(ctx, a: Greedy[int], b: str) -> None:
+    pass
+
+
+def test_greedy() -> None:
+    assert _run(greedy, "1 2 3 hi") == (([1, 2, 3], "hi"), {})
+
+    with pytest.raises(BadArgument, match="Failed to find any arguments"):
+        _run(greedy, "hi")
+
+
+@molter.msg_command()
+async def variable_str(ctx, a: int, *rest) -> None:
+    pass
+
+
+@molter.msg_command()
+async def variable_int(ctx, *rest: int) -> None:
+    pass
+
+
+def test_variable() -> None:
+    assert _run(variable_str, '1 a "b c" d') == ((1, ("a", "b c", "d")), {})
+    assert _run(variable_int, "1 2 3") == (((1, 2, 3),), {})
+
+
+_started: list[str] = []
+_cancelled: list[str] = []
+
+
+async def _slow_convert(ctx, arg: str) -> str:
+    _started.append(arg)
+    try:
+        if arg == "a":
+            await asyncio.sleep(0.05)
+            raise BadArgument("bad a")
+        if arg == "c":
+            raise BadArgument("bad c")
+        await asyncio.sleep(0.2)
+        return arg
+    except asyncio.CancelledError:
+        _cancelled.append(arg)
+        raise
+
+
+@molter.msg_command(concurrent_conversion=True)
+async def concurrent(ctx, *rest: Annotated[str, _slow_convert]) -> None:
+    pass
+
+
+@molter.msg_command()
+async def sequential(ctx, *rest: Annotated[str, _slow_convert]) -> None:
+    pass
+
+
+def test_concurrent_conversion_order() -> None:
+    _started.clear()
+    assert _run(concurrent, "b e") == ((("b", "e"),), {})
+    assert sorted(_started) == ["b", "e"]
+
+
+def test_concurrent_conversion_raises_first_bad_argument() -> None:
+    # c fails first, but a comes before it, so a's error is the one that counts
+    _started.clear()
+    _cancelled.clear()
+    with pytest.raises(BadArgument, match="bad a"):
+        _run(concurrent, "a b c d")
+    assert sorted(_cancelled) == ["b", "d"]
+
+
+def test_sequential_conversion_by_default() -> None:
+    _started.clear()
+    with pytest.raises(BadArgument, match="bad a"):
+        _run(sequential, "a b c d")
+    assert _started == ["a"]
+
+
+class _Scale:
+    @molter.msg_command()
+    async def base(self, ctx) -> None:
+        pass
+
+    @base.subcommand()
+    async def sub(self, ctx) -> None:
+        pass
+
+    @sub.subcommand(aliases=["dd"])
+    async def deep(self, ctx) -> None:
+        pass
+
+
+def test_get_command() -> None:
+    assert _Scale.base.get_command("sub") is _Scale.sub
+    assert _Scale.base.get_command("sub deep") is _Scale.deep
+    assert _Scale.base.get_command("sub  dd") is _Scale.deep
+    assert _Scale.base.get_command("sub nope") is None
+    assert _Scale.deep.qualified_name == "base sub deep"
+
+
+def test_command_dict_edits_are_seen() -> None:
+    _Scale.sub.remove_command("dd")
+    assert _Scale.base.get_command("sub dd") is None
+    assert _Scale.base.get_command("sub deep") is _Scale.deep
+
+    _Scale.sub.command_dict["dd"] = _Scale.deep
+    assert _Scale.base.get_command("sub dd") is _Scale.deep
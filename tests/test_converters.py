@@ -0,0 +1,92 @@
+import asyncio
+
+from molter import converters
+
+
+class _Guild:
+    def __init__(self, guild_id: int = 1, delay: float = 0.01) -> None:
+        self.id = guild_id
+        self.delay = delay
+        self.searches: list[str] = []
+
+    async def search_members(self, query: str, limit: int) -> list[str]:
+        self.searches.append(query)
+        await asyncio.sleep(self.delay)
+        return [query]
+
+
+def test_member_searches_are_shared() -> None:
+    guild = _Guild()
+
+    async def main() -> tuple:
+        together = await asyncio.gather(
+            converters._search_members(guild, "x", 30), converters._search_members(guild, "x", 30)
+        )
+        again = await converters._search_members(guild, "x", 30)
+        other = await converters._search_members(guild, "y", 30)
+        return together, again, other
+
+    together, again, other = asyncio.run(main())
+    assert together == [["x"], ["x"]]
+    assert again == ["x"] and other == ["y"]
+    assert guild.searches == ["x", "y"]
+
+
+def test_member_search_results_are_copies() -> None:
+    guild = _Guild()
+
+    async def main() -> list:
+        first = await converters._search_members(guild, "x", 30)
+        first.append("changed")
+        return await converters._search_members(guild, "x", 30)
+
+    assert asyncio.run(main()) == ["x"]
+
+
+def test_member_search_ttl() -> None:
+    guild = _Guild()
+
+    async def main() -> None:
+        await converters._search_members(guild, "x", 0)
+        await converters._search_members(guild, "x", 0)
+
+    asyncio.run(main())
+    assert guild.searches == ["x", "x"]
+
+
+def test_member_search_cache_is_bounded() -> None:
+    guild = _Guild(delay=0)
+
+    async def main() -> int:
+        for i in range(converters._MEMBER_SEARCH_MAX + 10):
+            await converters._search_members(guild, str(i), 30)
+        return len(converters._member_searches[asyncio.get_running_loop()])
+
+    assert asyncio.run(main()) == converters._MEMBER_SEARCH_MAX
+
+
+def test_member_searches_are_per_loop() -> None:
+    guild = _Guild()
+    asyncio.run(converters._search_members(guild, "x", 30))
+    asyncio.run(converters._search_members(guild, "x", 30))
+    assert guild.searches == ["x", "x"]
+
+
+def test_cancelled_member_search_is_evicted() -> None:
+    guild = _Guild(delay=1)
+
+    async def main() -> None:
+        task = asyncio.ensure_future(converters._search_members(guild, "x", 30))
+        await asyncio.sleep(0)
+
+        searches = converters._member_searches[asyncio.get_running_loop()]
+        searches[(guild.id, "x")][1].cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        await asyncio.sleep(0)
+
+        assert (guild.id, "x") not in searches
+
+    asyncio.run(main())
@@ -0,0 +1,158 @@
+import asyncio
+import re
+from typing import Optional
+
+import pytest
+from dis_snek.client.client import Snake
+from dis_snek.client.const import MENTION_PREFIX
+from dis_snek.models.snek.context import MessageContext
+
+import molter
+from molter import MolterSnake
+
+
+class _Author:
+    bot = False
+
+
+class _Message:
+    def __init__(self, content: str) -> None:
+        self.content = content
+        self.author = _Author()
+
+
+class _Event:
+    def __init__(self, content: str) -> None:
+        self.message = _Message(content)
+
+
+class _Bot(MolterSnake):
+    # just enough of a bot to dispatch commands without connecting to anything
+    def __init__(self, default_prefix: object = "!") -> None:
+        self.commands = {}
+        self.default_prefix = default_prefix
+        self.generate_prefixes = self.generate_prefixes
+        self.pre_run_callback = None
+        self.post_run_callback = None
+        self._mention_reg = re.compile(r"^(<@!?123*>\s)")
+        self.ran: list[tuple] = []
+
+    async def get_context(self, message: _Message) -> MessageContext:
+        ctx = MessageContext.__new__(MessageContext)
+        object.__setattr__(ctx, "message", message)
+        return ctx
+
+    async def _run_message_command(self, command: molter.MolterCommand, ctx: MessageContext) -> None:
+        self.ran.append((command.name, ctx.invoked_name, ctx.content_parameters))
+
+    async def on_command_error(self, ctx: MessageContext, error: Exception) -> None:
+        raise error
+
+    async def on_command(self, ctx: MessageContext) -> None:
+        pass
+
+    def dispatch(self, content: str) -> Optional[tuple]:
+        self.ran.clear()
+        asyncio.run(MolterSnake._dispatch_msg_commands.callback(self, _Event(content)))
+        return self.ran[0] if self.ran else None
+
+
+@molter.msg_command()
+async def top(ctx) -> None:
+    pass
+
+
+@top.subcommand()
+async def sub(ctx) -> None:
+    pass
+
+
+@sub.subcommand(aliases=["dd"])
+async def deep(ctx) -> None:
+    pass
+
+
+def _bot(default_prefix: object = "!") -> _Bot:
+    bot = _Bot(default_prefix)
+    bot.add_message_command(top)
+    return bot
+
+
+def test_dispatch_subcommands() -> None:
+    bot = _bot()
+    assert bot.dispatch("!top") == ("top", "top", "")
+    assert bot.dispatch("!top a b") == ("top", "top", "a b")
+    assert bot.dispatch("!top sub  dd x") == ("deep", "top sub  dd", "x")
+    assert bot.dispatch("!top\nsub y") == ("sub", "top\nsub", "y")
+    assert bot.dispatch("!nope") is None
+    assert bot.dispatch("top") is None
+    assert bot.dispatch("!") is None
+
+
+def test_find_prefix() -> None:
+    bot = _bot()
+    assert bot._find_prefix("!ping", ("?", "!")) == "!"
+    assert bot._find_prefix("ping", ("?", "!")) is None
+    assert bot._find_prefix("!!ping", ("!", "!!")) == "!"
+
+
+def test_mention_prefix() -> None:
+    bot = _bot((MENTION_PREFIX, "!"))
+    assert bot._find_prefix("<@123> hi", (MENTION_PREFIX, "!")) == "<@123> "
+    assert bot._find_prefix("<@!123> hi", (MENTION_PREFIX,)) == "<@!123> "
+    assert bot._find_prefix("hi <@123> hi", (MENTION_PREFIX,)) is None
+    assert bot._find_prefix("!hi", (MENTION_PREFIX, "!")) == "!"
+    assert bot.dispatch("<@123> top sub") == ("sub", "top sub", "")
+
+
+def test_static_prefixes() -> None:
+    bot = _bot(["?", "!"])
+    assert bot.dispatch("?top a") == ("top", "top", "a")
+
+    bot.default_prefix = "$"
+    assert bot.dispatch("?top a") is None
+    assert bot.dispatch("$top a") == ("top", "top", "a")
+
+    # changing the prefixes in place has to be noticed too
+    bot.default_prefix = ["?"]
+    assert bot.dispatch("&top") is None
+    bot.default_prefix.append("&")
+    assert bot.dispatch("&top") == ("top", "top", "")
+    bot.default_prefix.remove("&")
+    assert bot.dispatch("&top") is None
+
+
+def test_overridden_generate_prefixes_is_used() -> None:
+    bot = _bot("!")
+
+    async def generate_prefixes(bot: Snake, message: _Message) -> str:
+        return "%"
+
+    bot.generate_prefixes = generate_prefixes
+    assert bot._get_static_prefixes() is None
+    assert bot.dispatch("!top") is None
+    assert bot.dispatch("%top") == ("top", "top", "")
+
+
+def test_get_command() -> None:
+    bot = _bot()
+    assert bot.get_command("top") is top
+    assert bot.get_command("top sub dd") is deep
+    assert bot.get_command("top nope") is None
+    assert bot.get_command("top sub dd x") is None
+
+
+@pytest.mark.parametrize(
+    ("aliases", "duplicate"),
+    [(["q", "r", "q"], "q"), (["s", "cmd"], "cmd"), (["t", "top"], "top")],
+)
+def test_duplicate_aliases(aliases: list[str], duplicate: str) -> None:
+    bot = _bot()
+
+    @molter.msg_command(name="cmd", aliases=aliases)
+    async def cmd(ctx) -> None:
+        pass
+
+    with pytest.raises(ValueError, match=f"`{duplicate}`"):
+        bot.add_message_command(cmd)
+    assert all(alias not in bot.commands for alias in aliases if alias not in ("top", "cmd"))